@@ -1,8 +1,33 @@
 """Data validation application package."""
 
-from .data_validator import DataValidator
-from .validation_result import ValidationResult, ValidationEntry
-from .cli import CLI, CommandParser
+from importlib import import_module
+from typing import Any
 
 __version__ = "1.0.0"
-__all__ = ['DataValidator', 'ValidationResult', 'ValidationEntry', 'CLI', 'CommandParser']
\ No newline at end of file
+__all__ = ['DataValidator', 'ValidationResult', 'ValidationEntry', 'Severity', 'CLI', 'CommandParser']
+
+# Public names are imported on first access, so importing a lightweight
+# submodule such as src.validation_result does not pull in pandas
+_LAZY_ATTRIBUTES = {
+    'DataValidator': '.data_validator',
+    'ValidationResult': '.validation_result',
+    'ValidationEntry': '.validation_result',
+    'Severity': '.validation_result',
+    'CLI': '.cli',
+    'CommandParser': '.cli',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""Array kernels for the validation hot paths.
+
+Numba is an optional dependency: when it is installed the loops below are
+compiled, otherwise equivalent numpy implementations are used.
+"""
+
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def int_mask_numpy(values: np.ndarray) -> np.ndarray:
+    """Mark finite, integer-valued entries of a float64 array.
+    
+    Args:
+        values: Float64 array to check.
+    
+    Returns:
+        Boolean array, True where the value is a whole number.
+    """
+    return np.isfinite(values) & (values == np.floor(values))
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def int_mask(values: np.ndarray) -> np.ndarray:
+        """Numba-compiled equivalent of int_mask_numpy in a single pass."""
+        out = np.empty(values.size, dtype=np.bool_)
+        for i in range(values.size):
+            value = values[i]
+            out[i] = np.isfinite(value) and value == np.floor(value)
+        return out
+else:
+    int_mask = int_mask_numpy
+
+
+def mask_to_rows(mask: np.ndarray, index: Optional[Sequence[Any]] = None) -> List[Any]:
+    """Expand a boolean mask into the row labels it flags.
+    
+    This stays on np.flatnonzero rather than a compiled loop: numpy's
+    vectorized nonzero matches a Numba loop on sparse masks and is several
+    times faster on dense ones.
+    
+    Args:
+        mask: Boolean array over the rows.
+        index: Row labels aligned with mask. Positions are used if omitted.
+    
+    Returns:
+        List of the flagged row labels, in order.
+    """
+    positions = np.flatnonzero(mask)
+    if index is None:
+        return positions.tolist()
+    return index[positions].tolist()
\ No newline at end of file
@@ -9,6 +9,11 @@ import pandas as pd
 from .data_validator import DataValidator
 from .validation_result import ValidationResult
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class CommandParser:
     """Parses CLI commands for the data validation application."""
@@ -296,8 +301,12 @@ Use /help --command <command_name> for detailed help on specific commands.
             data: Data to save.
         """
         file_path = self.session_dir / filename
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            file_path.write_bytes(orjson.dumps(data, option=options))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(data, f, indent=2)
     
     def load_session_data(self, filename: str) -> Optional[Dict[str, Any]]:
         """Load data from session file.
@@ -313,6 +322,8 @@ Use /help --command <command_name> for detailed help on specific commands.
             return None
         
         try:
+            if orjson is not None:
+                return orjson.loads(file_path.read_bytes())
             with open(file_path, 'r') as f:
                 return json.load(f)
         except Exception as e:
@@ -1,26 +1,337 @@
 import pandas as pd
 import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, List, Optional, Union, Callable, Tuple, Iterator
 import openpyxl
 from openpyxl.styles import PatternFill
 import logging
 
+from ._fastpath import int_mask
 from .validation_result import ValidationResult
 
+# Prefer the Rust-based calamine reader for Excel files, falling back to openpyxl
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_ENGINE = 'openpyxl'
+
+# Stream output through xlsxwriter when installed, falling back to openpyxl
+try:
+    import xlsxwriter  # noqa: F401
+    _EXCEL_WRITER_ENGINE = 'xlsxwriter'
+except ImportError:
+    _EXCEL_WRITER_ENGINE = 'openpyxl'
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
+
+
+# Strings pd.read_csv treats as missing or boolean by default
+_CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+_CSV_TRUE_VALUES = ['True', 'TRUE', 'true']
+_CSV_FALSE_VALUES = ['False', 'FALSE', 'false']
+
+
+def _read_excel(file_path: str) -> pd.DataFrame:
+    """Read the first sheet of an Excel workbook with the preferred engine.
+    
+    Args:
+        file_path: Path to the Excel file.
+    
+    Returns:
+        DataFrame with the sheet contents.
+    """
+    return pd.read_excel(file_path, engine=_EXCEL_ENGINE)
+
+
+def _pandas_column_names(names: List[str]) -> List[str]:
+    """Rename CSV header names the way pd.read_csv does.
+    
+    Blank names become 'Unnamed: <position>' and repeated names get a '.<n>'
+    suffix, so every column can be addressed by a unique label.
+    
+    Args:
+        names: Header names as they appear in the file.
+    
+    Returns:
+        List of unique column names.
+    """
+    names = [name if name else f'Unnamed: {i}' for i, name in enumerate(names)]
+    counts: Dict[str, int] = {}
+    
+    for i, base in enumerate(names):
+        name = base
+        count = counts.get(name, 0)
+        # Suffixes already used elsewhere in the header are skipped
+        while count > 0:
+            counts[base] = count + 1
+            name = f'{base}.{count}'
+            count = count + 1 if name in names else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    
+    return names
+
+
+def _read_csv(file_path: str) -> pd.DataFrame:
+    """Read a CSV file, using PyArrow's multithreaded parser when available.
+    
+    The Arrow result is aligned with pd.read_csv: pandas' missing-value and
+    boolean tokens are used, header names are made unique the same way, and
+    date and timestamp columns that Arrow infers are re-read as strings. Files
+    Arrow rejects, such as ones with ragged rows, and files with integers
+    beyond the int64 range are left to pandas.
+    
+    Args:
+        file_path: Path to the CSV file.
+    
+    Returns:
+        DataFrame with the file contents.
+    """
+    if pacsv is None:
+        return pd.read_csv(file_path)
+    
+    read_options = pacsv.ReadOptions(use_threads=True)
+    convert_options = pacsv.ConvertOptions(
+        null_values=_CSV_NA_VALUES,
+        true_values=_CSV_TRUE_VALUES,
+        false_values=_CSV_FALSE_VALUES,
+        strings_can_be_null=True
+    )
+    
+    try:
+        table = pacsv.read_csv(file_path, read_options=read_options, convert_options=convert_options)
+        
+        # Arrow infers integers beyond int64 as doubles, losing digits pandas keeps
+        for column, field in zip(table.columns, table.schema):
+            if pa.types.is_floating(field.type) and (pc.max(pc.abs(column)).as_py() or 0) >= 2 ** 63:
+                return pd.read_csv(file_path)
+        
+        names = _pandas_column_names(table.column_names)
+        
+        temporal_columns = [name for name, field in zip(names, table.schema) if pa.types.is_temporal(field.type)]
+        if temporal_columns:
+            # Name the columns up front so the string overrides address each one unambiguously
+            read_options.column_names = names
+            read_options.skip_rows = 1
+            convert_options.column_types = {name: pa.string() for name in temporal_columns}
+            table = pacsv.read_csv(file_path, read_options=read_options, convert_options=convert_options)
+        else:
+            table = table.rename_columns(names)
+    except pa.ArrowInvalid:
+        return pd.read_csv(file_path)
+    
+    return table.to_pandas()
+
+
+def _empty_string_mask(values: pd.Series) -> np.ndarray:
+    """Mark empty or whitespace-only strings in an object column.
+    
+    Uses PyArrow string kernels when the column holds only strings, and
+    falls back to checking the str values one by one for mixed-type columns.
+    
+    Args:
+        values: Object-dtype Series to check.
+        
+    Returns:
+        Boolean array, True where the value is a blank string.
+    """
+    if pc is not None:
+        try:
+            strings = pa.array(values, type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            strings = None
+        
+        if strings is not None:
+            lengths = pc.utf8_length(pc.utf8_trim_whitespace(strings))
+            return pc.equal(lengths, 0).fill_null(False).to_numpy(zero_copy_only=False)
+    
+    # Only str values can be blank; a fixed-width string copy would be sized by the longest value
+    return np.fromiter(
+        (isinstance(value, str) and not value.strip() for value in values), dtype=bool, count=len(values)
+    )
+
+
+def _excel_cell_value(value: Any, datetime_format: str, date_format: str) -> Tuple[Any, Optional[str]]:
+    """Convert a DataFrame value the way DataFrame.to_excel does before writing a cell.
+    
+    Missing values become empty strings and infinities become 'inf' or '-inf',
+    matching to_excel's default na_rep and inf_rep. Numbers and booleans are
+    written as Python scalars, dates with the writer's formats, timedeltas
+    as fractional days, and anything else as its string representation.
+    
+    Args:
+        value: Value taken from the DataFrame.
+        datetime_format: Number format the writer uses for datetimes.
+        date_format: Number format the writer uses for dates.
+    
+    Returns:
+        Tuple of the value to write and its number format, or None for the default.
+    """
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return '', None
+    if pd.api.types.is_integer(value):
+        return int(value), None
+    if pd.api.types.is_float(value):
+        if np.isinf(value):
+            return ('inf' if value > 0 else '-inf'), None
+        return float(value), None
+    if pd.api.types.is_bool(value):
+        return bool(value), None
+    if isinstance(value, datetime):
+        return value, datetime_format
+    if isinstance(value, date):
+        return value, date_format
+    if isinstance(value, timedelta):
+        return value.total_seconds() / 86400, '0'
+    return str(value), None
+
+
+# Readers for the supported input formats, keyed by lowercase file suffix
+_READERS: Dict[str, Callable[[str], pd.DataFrame]] = {
+    '.xlsx': _read_excel,
+    '.csv': _read_csv
+}
+
+
+def _reader_for(file_path: str) -> Callable[[str], pd.DataFrame]:
+    """Look up the reader for a file based on its extension.
+    
+    Args:
+        file_path: Path to the file to read.
+    
+    Returns:
+        Function loading the file into a DataFrame.
+    
+    Raises:
+        ValueError: If the file format is not supported.
+    """
+    reader = _READERS.get(Path(file_path).suffix.lower())
+    if reader is None:
+        raise ValueError(f"Unsupported file format: {file_path}")
+    return reader
+
+
+# Frames with fewer cells than this are validated column by column on the calling thread
+_PARALLEL_MIN_CELLS = 100_000
+
+
+def _is_int(value: Any) -> bool:
+    """Check if a value is an integer or can be parsed as one."""
+    if isinstance(value, (int, np.integer)):
+        return True
+    if isinstance(value, (float, np.floating)):
+        return value.is_integer()
+    if isinstance(value, str):
+        try:
+            int(value)
+        except ValueError:
+            return False
+        return True
+    return False
+
+
+def _is_float(value: Any) -> bool:
+    """Check if a value is a number or can be parsed as a float."""
+    if isinstance(value, (int, float, np.number)):
+        return True
+    if isinstance(value, str):
+        try:
+            float(value)
+        except ValueError:
+            return False
+        return True
+    return False
+
+
+def _is_str(value: Any) -> bool:
+    """Check if a value is a string."""
+    return isinstance(value, str)
+
+
+def _is_bool(value: Any) -> bool:
+    """Check if a value is a boolean."""
+    return isinstance(value, (bool, np.bool_))
+
+
+def _column_runs(cells: List[Tuple[int, int]]) -> Iterator[Tuple[int, int, int]]:
+    """Merge sorted (row, col) cell positions into runs of adjacent columns.
+    
+    Args:
+        cells: Cell positions sorted by row, then column.
+        
+    Yields:
+        Tuples of (row, first_col, last_col) covering the given cells.
+    """
+    run = None
+    for row, col in cells:
+        if run is not None and row == run[0] and col == run[2] + 1:
+            run[2] = col
+            continue
+        if run is not None:
+            yield tuple(run)
+        run = [row, col, col]
+    if run is not None:
+        yield tuple(run)
+
+
+# Background colors used to highlight cells, keyed by severity
+_SEVERITY_COLORS = {
+    'error': 'FFCCCC',
+    'warning': 'FFFFCC',
+    'passed': 'CCFFCC'
+}
+
+# Per-value checkers keyed by the type names accepted in validation rules
+_TYPE_CHECKERS: Dict[str, Callable[[Any], bool]] = {
+    'int': _is_int,
+    'float': _is_float,
+    'str': _is_str,
+    'bool': _is_bool
+}
+
+
+# NumPy dtype kinds whose values always satisfy a type rule
+_DTYPE_KINDS = {
+    'int': 'biu',
+    'float': 'biuf',
+    'bool': 'b'
+}
+
 
 class DataValidator:
     """Core data validation engine for Excel and CSV files."""
     
-    def __init__(self):
-        """Initialize the data validator."""
+    def __init__(self, collect_passed: bool = False, max_workers: Optional[int] = None):
+        """Initialize the data validator.
+        
+        Args:
+            collect_passed: Record a passed entry for every valid value instead of
+                one aggregated entry per column.
+            max_workers: Number of threads used to validate columns of large
+                frames. Defaults to the number of CPUs; 1 disables threading.
+        """
         self.logger = logging.getLogger(__name__)
+        self.collect_passed = collect_passed
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
         
         # Color schemes for Excel output
         self.colors = {
-            'error': PatternFill(start_color='FFCCCC', end_color='FFCCCC', fill_type='solid'),
-            'warning': PatternFill(start_color='FFFFCC', end_color='FFFFCC', fill_type='solid'),
-            'passed': PatternFill(start_color='CCFFCC', end_color='CCFFCC', fill_type='solid')
+            severity: PatternFill(start_color=color, end_color=color, fill_type='solid')
+            for severity, color in _SEVERITY_COLORS.items()
         }
     
     def validate_file(self, file_path: str, rules: Dict[str, Any]) -> ValidationResult:
@@ -42,16 +353,12 @@ class DataValidator:
         
         # Load the data
         try:
-            if file_path.endswith('.xlsx'):
-                df = pd.read_excel(file_path)
-            elif file_path.endswith('.csv'):
-                df = pd.read_csv(file_path)
-            else:
-                raise ValueError(f"Unsupported file format: {file_path}")
+            df = _reader_for(file_path)(file_path)
         except Exception as e:
             raise ValueError(f"Error reading file {file_path}: {str(e)}")
         
         result = ValidationResult(source_file=file_path)
+        result.source_data = df
         
         # Check for empty dataframe
         if df.empty:
@@ -63,17 +370,11 @@ class DataValidator:
             self._validate_required_columns(df, rules['required_columns'], result)
         
         # Detect missing values
-        missing_result = self.detect_missing_values(df)
-        result.errors.extend(missing_result.errors)
-        result.warnings.extend(missing_result.warnings)
-        result.passed.extend(missing_result.passed)
+        result.merge(self.detect_missing_values(df))
         
         # Validate data types
         if 'data_types' in rules:
-            type_result = self.validate_data_types(df, rules['data_types'])
-            result.errors.extend(type_result.errors)
-            result.warnings.extend(type_result.warnings)
-            result.passed.extend(type_result.passed)
+            result.merge(self.validate_data_types(df, rules['data_types']))
         
         return result
     
@@ -92,29 +393,35 @@ class DataValidator:
             result.add_warning('Empty dataframe provided', '', None)
             return result
         
-        for column in df.columns:
-            # Check for None/NaN values
-            null_mask = df[column].isnull()
-            null_indices = df[null_mask].index.tolist()
+        # Build the (rows x columns) null mask in a single pass over the frame
+        null_mask = df.isnull().to_numpy()
+        object_columns = (df.dtypes == 'object').to_numpy()
+        index = df.index.to_numpy()
+        
+        def _check_col(position: int) -> ValidationResult:
+            column_result = ValidationResult(source_file='')
+            column = df.columns[position]
+            column_nulls = null_mask[:, position]
             
-            # Check for empty strings
-            if df[column].dtype == 'object':
-                empty_mask = df[column].astype(str).str.strip() == ''
-                empty_indices = df[empty_mask & ~null_mask].index.tolist()
+            # Empty strings can only occur in object columns
+            if object_columns[position]:
+                column_empty = _empty_string_mask(df.iloc[:, position]) & ~column_nulls
             else:
-                empty_indices = []
-            
-            # Record findings
-            for idx in null_indices:
-                result.add_error(f'Missing value (null/NaN)', column, idx)
+                column_empty = np.zeros_like(column_nulls)
             
-            for idx in empty_indices:
-                result.add_error(f'Missing value (empty string)', column, idx)
+            # Record findings in bulk, only touching the offending rows
+            column_result.add_errors_from_mask('Missing value (null/NaN)', column, column_nulls, index)
+            column_result.add_errors_from_mask('Missing value (empty string)', column, column_empty, index)
             
             # Record passed validations for non-missing values
-            valid_count = len(df) - len(null_indices) - len(empty_indices)
+            valid_count = len(df) - int(column_nulls.sum()) - int(column_empty.sum())
             if valid_count > 0:
-                result.add_passed(f'{valid_count} valid values', column)
+                column_result.add_passed(f'{valid_count} valid values', column)
+            
+            return column_result
+        
+        for column_result in self._map_columns(_check_col, range(len(df.columns)), df.size):
+            result.merge(column_result)
         
         return result
     
@@ -130,33 +437,132 @@ class DataValidator:
         """
         result = ValidationResult(source_file='')
         
-        for column, expected_type in type_rules.items():
+        def _check_col(rule: Tuple[str, str]) -> ValidationResult:
+            column, expected_type = rule
+            column_result = ValidationResult(source_file='')
+            
             if column not in df.columns:
-                result.add_error(f'Column not found in data', column, None)
-                continue
+                column_result.add_error(f'Column not found in data', column, None)
+                return column_result
             
             col_data = df[column].dropna()  # Remove NaN values for type checking
             
             if col_data.empty:
-                result.add_warning(f'Column contains only missing values', column, None)
-                continue
+                column_result.add_warning(f'Column contains only missing values', column, None)
+                return column_result
+            
+            # Columns whose dtype already guarantees the expected type need no per-value checks
+            if self._dtype_matches(col_data, expected_type):
+                self._record_passed_values(column_result, column, expected_type, col_data.index)
+                return column_result
+            
+            # Check all values against expected type at once, then report only the invalid ones
+            valid_mask = self._valid_type_mask(col_data, expected_type)
             
-            # Check each value against expected type
-            for idx, value in col_data.items():
-                is_valid = self._check_data_type(value, expected_type)
-                
-                if not is_valid:
-                    result.add_error(
-                        f'Invalid data type. Expected {expected_type}, got {type(value).__name__}',
-                        column,
-                        idx,
-                        value
-                    )
-                else:
-                    result.add_passed(f'Valid {expected_type} value', column, idx)
+            # Only the invalid positions are boxed into Python objects
+            bad_positions = np.flatnonzero(~valid_mask)
+            bad_rows = col_data.index[bad_positions].tolist()
+            bad_values = col_data.iloc[bad_positions].tolist()
+            
+            for idx, value in zip(bad_rows, bad_values):
+                column_result.add_error(
+                    f'Invalid data type. Expected {expected_type}, got {type(value).__name__}',
+                    column,
+                    idx,
+                    value
+                )
+            
+            if valid_mask.any():
+                self._record_passed_values(column_result, column, expected_type, col_data.index[valid_mask])
+            
+            return column_result
+        
+        checked_cells = len(df) * len(type_rules)
+        for column_result in self._map_columns(_check_col, list(type_rules.items()), checked_cells):
+            result.merge(column_result)
         
         return result
     
+    def _map_columns(self, check: Callable[[Any], ValidationResult], items: Any,
+                     cells: int) -> Iterator[ValidationResult]:
+        """Run a per-column check over items, in parallel for large frames.
+        
+        The numpy and PyArrow kernels doing the heavy lifting release the GIL,
+        so a thread pool spreads wide frames across cores. Results are yielded
+        in the order of items either way.
+        
+        Args:
+            check: Function validating a single column.
+            items: Columns (or rules) to check.
+            cells: Number of cells the checks will touch.
+        
+        Returns:
+            Iterator over the per-column results.
+        """
+        if self.max_workers <= 1 or len(items) < 2 or cells < _PARALLEL_MIN_CELLS:
+            return map(check, items)
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return iter(list(executor.map(check, items)))
+    
+    def _record_passed_values(self, result: ValidationResult, column: str, expected_type: str,
+                              valid_index: pd.Index) -> None:
+        """Record values of a column that passed type validation.
+        
+        Args:
+            result: ValidationResult to update.
+            column: Column name that was validated.
+            expected_type: Expected type the values matched.
+            valid_index: Index labels of the valid values.
+        """
+        if not self.collect_passed:
+            result.add_passed(f'{len(valid_index)} valid {expected_type} values', column)
+            return
+        
+        result.add_passed_rows(f'Valid {expected_type} value', column, valid_index.tolist())
+    
+    def _dtype_matches(self, col_data: pd.Series, expected_type: str) -> bool:
+        """Check whether a column's dtype alone guarantees every value has the expected type.
+        
+        Args:
+            col_data: Series of non-null values to check.
+            expected_type: Expected type as string ('int', 'float', 'str', etc.).
+            
+        Returns:
+            True if all values are known to be valid without inspecting them.
+        """
+        if expected_type == 'str':
+            return col_data.dtype.kind in 'OU' and pd.api.types.infer_dtype(col_data, skipna=True) == 'string'
+        
+        return col_data.dtype.kind in _DTYPE_KINDS.get(expected_type, '')
+    
+    def _valid_type_mask(self, col_data: pd.Series, expected_type: str) -> np.ndarray:
+        """Build a boolean mask marking values that match the expected data type.
+        
+        Numeric types are probed with vectorized pandas conversions; other types
+        fall back to a per-value check.
+        
+        Args:
+            col_data: Series of non-null values to check.
+            expected_type: Expected type as string ('int', 'float', 'str', etc.).
+        
+        Returns:
+            Boolean array aligned with col_data, True where the value is valid.
+        """
+        if expected_type in ('int', 'float') and (col_data.dtype.kind in 'biuf' or col_data.dtype == 'object'):
+            numeric = pd.to_numeric(col_data, errors='coerce')
+            if expected_type == 'int':
+                return int_mask(numeric.to_numpy(dtype=np.float64, na_value=np.nan))
+            return numeric.notna().to_numpy(dtype=bool)
+        
+        # Resolve the per-value checker once for the whole column
+        checker = _TYPE_CHECKERS.get(expected_type)
+        if checker is None:
+            self.logger.warning(f"Unknown data type: {expected_type}")
+            return np.ones(len(col_data), dtype=bool)
+        
+        return col_data.map(checker).to_numpy(dtype=bool)
+    
     def _validate_required_columns(self, df: pd.DataFrame, required_columns: List[str], result: ValidationResult) -> None:
         """Validate that all required columns are present.
         
@@ -174,48 +580,6 @@ class DataValidator:
             if column in df.columns:
                 result.add_passed(f'Required column present', column)
     
-    def _check_data_type(self, value: Any, expected_type: str) -> bool:
-        """Check if a value matches the expected data type.
-        
-        Args:
-            value: Value to check.
-            expected_type: Expected type as string ('int', 'float', 'str', etc.).
-            
-        Returns:
-            True if value matches expected type, False otherwise.
-        """
-        try:
-            if expected_type == 'int':
-                if isinstance(value, (int, np.integer)):
-                    return True
-                if isinstance(value, (float, np.floating)):
-                    return value.is_integer()
-                if isinstance(value, str):
-                    int(value)
-                    return True
-                return False
-            
-            elif expected_type == 'float':
-                if isinstance(value, (int, float, np.number)):
-                    return True
-                if isinstance(value, str):
-                    float(value)
-                    return True
-                return False
-            
-            elif expected_type == 'str':
-                return isinstance(value, str)
-            
-            elif expected_type == 'bool':
-                return isinstance(value, (bool, np.bool_))
-            
-            else:
-                self.logger.warning(f"Unknown data type: {expected_type}")
-                return True
-                
-        except (ValueError, TypeError):
-            return False
-    
     def generate_colored_output(self, result: ValidationResult, output_path: str) -> None:
         """Generate color-coded Excel output with validation results.
         
@@ -223,29 +587,22 @@ class DataValidator:
             result: ValidationResult containing validation findings.
             output_path: Path where the output Excel file should be saved.
         """
-        # Load original data
-        if result.source_file.endswith('.xlsx'):
-            original_df = pd.read_excel(result.source_file)
+        # Reuse the data parsed during validation, loading it only if it is not available
+        if result.source_data is not None:
+            original_df = result.source_data
         else:
-            original_df = pd.read_csv(result.source_file)
-        
-        # Create a copy for styling
-        styled_df = original_df.copy()
-        
-        # Create summary data
-        summary_data = []
-        all_entries = result.errors + result.warnings + result.passed
+            original_df = _reader_for(result.source_file)(result.source_file)
         
-        for entry in all_entries:
-            summary_data.append({
-                'Column': entry.column,
-                'Row': entry.row if entry.row is not None else 'All',
-                'Severity': entry.severity.title(),
-                'Message': entry.message,
-                'Value': entry.value if entry.value is not None else ''
-            })
+        # Create summary data straight from the result's column storage
+        entries = result.to_dataframe()
         
-        summary_df = pd.DataFrame(summary_data)
+        summary_df = pd.DataFrame({
+            'Column': entries['column'],
+            'Row': entries['row'].where(entries['row'].notna(), 'All'),
+            'Severity': entries['severity'].cat.rename_categories(str.title),
+            'Message': entries['message'],
+            'Value': entries['value'].where(entries['value'].notna(), '')
+        })
         
         # Create lineage data
         lineage_data = [{
@@ -260,45 +617,102 @@ class DataValidator:
         lineage_df = pd.DataFrame(lineage_data)
         
         # Write to Excel with multiple sheets
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        with pd.ExcelWriter(output_path, engine=_EXCEL_WRITER_ENGINE) as writer:
             # Write the original data (will be colored)
-            styled_df.to_excel(writer, sheet_name='Validated_Data', index=False)
+            original_df.to_excel(writer, sheet_name='Validated_Data', index=False)
             summary_df.to_excel(writer, sheet_name='Summary', index=False)
             lineage_df.to_excel(writer, sheet_name='Data_Lineage', index=False)
             
             # Apply color coding to the validated data sheet
-            self._apply_color_coding(writer, result, 'Validated_Data')
+            self._apply_color_coding(writer, entries, 'Validated_Data', original_df)
     
-    def _apply_color_coding(self, writer: pd.ExcelWriter, result: ValidationResult, sheet_name: str) -> None:
+    def _apply_color_coding(self, writer: pd.ExcelWriter, entries: pd.DataFrame, sheet_name: str,
+                            data: pd.DataFrame) -> None:
         """Apply color coding to Excel cells based on validation results.
         
         Args:
             writer: Excel writer object.
-            result: ValidationResult containing validation findings.
+            entries: Validation findings as exported by ValidationResult.to_dataframe().
             sheet_name: Name of the sheet to apply coloring to.
+            data: DataFrame written to the sheet.
+        """
+        # Map column names to 1-indexed Excel column positions once per category, 0 if absent
+        col_idx_map = {column: idx + 1 for idx, column in enumerate(data.columns)}
+        category_positions = np.array(
+            [col_idx_map.get(column, 0) for column in entries['column'].cat.categories], dtype=np.int64
+        )
+        
+        # Compute cell positions vectorized over the entry columns
+        col_idxs = category_positions[entries['column'].cat.codes.to_numpy()]
+        mapped = entries['row'].notna().to_numpy() & (col_idxs > 0)
+        
+        # Convert to 1-indexed for Excel (add 2 for header row)
+        excel_rows = entries['row'][mapped].astype(int) + 2
+        
+        # Create a mapping of (row, col) to severity; later entries take precedence
+        cell_severity = dict(zip(
+            zip(excel_rows.tolist(), col_idxs[mapped].tolist()),
+            entries['severity'][mapped].tolist()
+        ))
+        
+        if writer.engine == 'xlsxwriter':
+            self._apply_xlsxwriter_formats(writer, sheet_name, data, cell_severity)
+            return
+        
+        worksheet = writer.book[sheet_name]
+        
+        # Group cells by severity so each fill is resolved once
+        cells_by_severity: Dict[str, List[Tuple[int, int]]] = {}
+        for cell_position, severity in cell_severity.items():
+            cells_by_severity.setdefault(severity, []).append(cell_position)
+        
+        # Apply colors over runs of adjacent cells rather than addressing cells one by one.
+        # Cells are addressed by numeric position: 'A1'-style coordinates are parsed on
+        # every lookup and measured several times slower than iter_rows.
+        for severity, cell_positions in cells_by_severity.items():
+            fill = self.colors.get(severity)
+            if fill is None:
+                continue
+            
+            for row, first_col, last_col in _column_runs(sorted(cell_positions)):
+                for cell in next(worksheet.iter_rows(min_row=row, max_row=row, min_col=first_col, max_col=last_col)):
+                    cell.fill = fill
+    
+    def _apply_xlsxwriter_formats(self, writer: pd.ExcelWriter, sheet_name: str, data: pd.DataFrame,
+                                  cell_severity: Dict[Tuple[int, int], str]) -> None:
+        """Highlight cells in a sheet written by the xlsxwriter engine.
+        
+        xlsxwriter cannot restyle a cell after it has been written, so each
+        highlighted cell is rewritten with a severity format. Values go through
+        the same conversion to_excel applied, so highlighted cells hold what
+        the rest of the sheet does.
+        
+        Args:
+            writer: Excel writer object using the xlsxwriter engine.
+            sheet_name: Name of the sheet to apply coloring to.
+            data: DataFrame written to the sheet.
+            cell_severity: Mapping of 1-indexed (row, col) positions to severity.
         """
         workbook = writer.book
-        worksheet = workbook[sheet_name]
-        
-        # Create a mapping of (row, col) to severity
-        cell_severity = {}
-        
-        for entry in result.errors + result.warnings + result.passed:
-            if entry.row is not None:
-                # Convert to 1-indexed for Excel (add 2 for header row)
-                excel_row = entry.row + 2
-                
-                # Find column index
-                try:
-                    if sheet_name in writer.sheets:
-                        df = pd.read_excel(result.source_file)
-                        col_idx = list(df.columns).index(entry.column) + 1  # 1-indexed
-                        cell_severity[(excel_row, col_idx)] = entry.severity
-                except (ValueError, KeyError):
-                    continue
-        
-        # Apply colors
+        worksheet = writer.sheets[sheet_name]
+        
+        # One format per severity (and per number format), shared by all cells
+        formats = {}
+        
+        def get_format(severity: str, num_format: Optional[str] = None):
+            key = (severity, num_format)
+            if key not in formats:
+                properties = {'bg_color': f'#{_SEVERITY_COLORS[severity]}', 'pattern': 1}
+                if num_format is not None:
+                    properties['num_format'] = num_format
+                formats[key] = workbook.add_format(properties)
+            return formats[key]
+        
         for (row, col), severity in cell_severity.items():
-            cell = worksheet.cell(row=row, column=col)
-            if severity in self.colors:
-                cell.fill = self.colors[severity]
\ No newline at end of file
+            if severity not in _SEVERITY_COLORS:
+                continue
+            
+            # Convert back to 0-indexed positions
+            row, col = row - 1, col - 1
+            value, num_format = _excel_cell_value(data.iat[row - 1, col], writer.datetime_format, writer.date_format)
+            worksheet.write(row, col, value, get_format(severity, num_format))
\ No newline at end of file
@@ -1,20 +1,240 @@
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+import sys
+from array import array
+from dataclasses import dataclass, field
+from enum import IntEnum
+from itertools import chain, repeat
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Hashable, Sequence, Tuple, Union, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ValidationEntry:
-    """Represents a single validation entry (error, warning, or passed)."""
+    """Represents a single validation entry (error, warning, or passed).
+    
+    Entries are immutable and hashable; the value is left out of the hash so
+    that entries holding unhashable values can still be used as keys.
+    """
     
     message: str
     column: str
     row: Optional[int] = None
     severity: str = 'error'  # 'error', 'warning', or 'passed'
-    value: Optional[Any] = None
+    value: Optional[Any] = field(default=None, hash=False)
+
+
+class Severity(IntEnum):
+    """Severity of a validation entry, used internally to index per-severity storage."""
+    
+    ERROR = 0
+    WARNING = 1
+    PASSED = 2
+
+
+# Severity names exposed on ValidationEntry, indexed by Severity
+SEVERITIES = tuple(sys.intern(severity.name.lower()) for severity in Severity)
+
+
+class _Categories:
+    """Assigns small integer codes to labels that repeat across many entries."""
+    
+    def __init__(self):
+        """Initialize an empty set of categories."""
+        self.labels: List[Hashable] = []
+        self._codes: Dict[Hashable, int] = {}
+    
+    def encode(self, label: Hashable) -> int:
+        """Get the code for a label, registering it if it is new.
+        
+        Args:
+            label: Label to encode.
+        
+        Returns:
+            Integer code of the label.
+        """
+        code = self._codes.get(label)
+        if code is None:
+            # Interned labels make later lookups with the same name an identity check
+            if type(label) is str:
+                label = sys.intern(label)
+            code = self._codes[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+    
+    def decode(self, codes: Iterable[int]) -> List[Hashable]:
+        """Translate a sequence of codes back into labels.
+        
+        Args:
+            codes: Codes to translate.
+        
+        Returns:
+            List of labels.
+        """
+        return list(map(self.labels.__getitem__, codes))
+
+
+# Stands for a missing row in packed row storage; negative row labels remain valid
+_NO_ROW = -2 ** 63
+
+
+class _EntryColumns:
+    """Struct-of-arrays storage for validation entries.
+    
+    Rows are packed into a signed 64-bit array while every row is an integer
+    or None, and switch to a plain list the first time another label is added.
+    Values are kept sparsely, keyed by position, since most entries have none.
+    """
+    
+    __slots__ = ('message_codes', 'column_codes', 'rows', 'values')
+    
+    def __init__(self):
+        """Initialize empty column arrays."""
+        self.message_codes: List[int] = []
+        self.column_codes: List[int] = []
+        self.rows: Union[array, List[Any]] = array('q')
+        # Values of the entries that have one; entries missing here have no value
+        self.values: Dict[int, Any] = {}
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def append_row(self, row: Optional[Any]) -> None:
+        """Append a single row label.
+        
+        Args:
+            row: Row label, or None if the entry has no row.
+        """
+        if type(self.rows) is array:
+            if row is None:
+                row = _NO_ROW
+            elif type(row) is not int or not _NO_ROW < row < 2 ** 63:
+                self._unpack_rows()
+        self.rows.append(row)
+    
+    def extend_rows(self, rows: Sequence[Any]) -> None:
+        """Append row labels in bulk.
+        
+        Args:
+            rows: Row labels, None for entries without a row.
+        """
+        if type(self.rows) is array:
+            try:
+                packed = array('q', rows)
+            except (TypeError, OverflowError):
+                packed = None
+            
+            if packed is not None and _NO_ROW not in packed:
+                self.rows.extend(packed)
+                return
+            
+            for row in rows:
+                self.append_row(row)
+            return
+        
+        self.rows.extend(rows)
+    
+    def row_list(self, start: int = 0) -> List[Any]:
+        """Get the row labels from a position onwards, with None for missing rows.
+        
+        Args:
+            start: Position of the first row to return.
+        
+        Returns:
+            List of row labels.
+        """
+        if type(self.rows) is not array:
+            return self.rows[start:]
+        
+        rows = self.rows[start:]
+        if _NO_ROW in rows:
+            return [None if row == _NO_ROW else row for row in rows.tolist()]
+        return rows.tolist()
+    
+    def take(self, positions: Sequence[int]) -> Tuple[List[int], List[int], List[Any], List[Any]]:
+        """Gather the entries at the given positions.
+        
+        Args:
+            positions: Positions of the entries, in the order wanted.
+        
+        Returns:
+            Message codes, column codes, rows (None for missing rows) and values.
+        """
+        rows = list(map(self.rows.__getitem__, positions))
+        if type(self.rows) is array and _NO_ROW in rows:
+            rows = [None if row == _NO_ROW else row for row in rows]
+        
+        values = list(map(self.values.get, positions)) if self.values else [None] * len(positions)
+        
+        return (
+            list(map(self.message_codes.__getitem__, positions)),
+            list(map(self.column_codes.__getitem__, positions)),
+            rows,
+            values
+        )
+    
+    def _unpack_rows(self) -> None:
+        """Switch row storage from the packed array to a list."""
+        self.rows = self.row_list()
+
+
+class EntryView(Sequence):
+    """Read-only sequence of ValidationEntry objects backed by columnar storage.
+    
+    Entries are materialized on first access, so building them is only paid
+    for by consumers that actually need entry objects.
+    """
+    
+    def __init__(self, result: 'ValidationResult', severity: Severity):
+        """Initialize a view over one severity of a validation result.
+        
+        Args:
+            result: ValidationResult holding the storage.
+            severity: Severity whose entries are exposed.
+        """
+        self._result = result
+        self._severity = severity
+    
+    def __len__(self) -> int:
+        return len(self._result._checked_positions(self._severity))
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[ValidationEntry, List[ValidationEntry]]:
+        return self._result._entries(self._severity)[index]
+    
+    def __iter__(self) -> Iterator[ValidationEntry]:
+        return iter(self._result._entries(self._severity))
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (EntryView, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __add__(self, other: Iterable[ValidationEntry]) -> List[ValidationEntry]:
+        return list(self) + list(other)
+    
+    def __radd__(self, other: Iterable[ValidationEntry]) -> List[ValidationEntry]:
+        return list(other) + list(self)
+    
+    def __repr__(self) -> str:
+        return f'EntryView({list(self)!r})'
 
 
 class ValidationResult:
-    """Stores the results of data validation operations."""
+    """Stores the results of data validation operations.
+    
+    Entries of all severities are kept column-wise in a single store, in the
+    order they were added: column names and messages as integer codes into
+    shared category tables, rows and values as plain columns. Per-severity
+    tables of store positions back the errors, warnings and passed
+    attributes, which expose the entries as sequences of ValidationEntry
+    objects.
+    
+    An error is recorded once per message, column and row; adding it again,
+    directly or through merge, has no effect. Repeats are dropped in bulk the
+    next time errors are read rather than looked up on every insert.
+    """
     
     def __init__(self, source_file: str):
         """Initialize validation result for a source file.
@@ -23,9 +243,157 @@ class ValidationResult:
             source_file: Path to the source file being validated.
         """
         self.source_file = source_file
-        self.errors: List[ValidationEntry] = []
-        self.warnings: List[ValidationEntry] = []
-        self.passed: List[ValidationEntry] = []
+        # Parsed contents of source_file, kept so reporting can skip re-reading the file
+        self.source_data: Optional[Any] = None
+        self._columns = _Categories()
+        self._messages = _Categories()
+        self._store = _EntryColumns()
+        # Store positions of the entries of each severity, in insertion order
+        self._positions: List[array] = [array('I') for _ in Severity]
+        # Entry objects materialized so far, reused across accesses since the store only grows
+        self._entry_cache: List[List[ValidationEntry]] = [[] for _ in Severity]
+        # Number of leading error positions already checked for repeats
+        self._checked_errors = 0
+        # Last summary returned by get_summary, with the state it was computed from
+        self._summary_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state to pickle: the source file and the columnar storage.
+        
+        Materialized entries, the cached summary and the parsed source data are
+        left out, so results travel between processes as a few flat arrays.
+        
+        Returns:
+            Dictionary of picklable state.
+        """
+        self._checked_positions(Severity.ERROR)
+        store = self._store
+        return {
+            'source_file': self.source_file,
+            'columns': self._columns.labels,
+            'messages': self._messages.labels,
+            'store': (store.message_codes, store.column_codes, store.rows, store.values),
+            'positions': self._positions
+        }
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled result, rebuilding the category lookups from the storage.
+        
+        Args:
+            state: State produced by __getstate__.
+        """
+        self.__init__(state['source_file'])
+        for label in state['columns']:
+            self._columns.encode(label)
+        for label in state['messages']:
+            self._messages.encode(label)
+        
+        store = self._store
+        store.message_codes, store.column_codes, store.rows, store.values = state['store']
+        self._positions = state['positions']
+        # Repeated errors were dropped before pickling
+        self._checked_errors = len(self._positions[Severity.ERROR])
+    
+    @property
+    def errors(self) -> EntryView:
+        """Errors found during validation."""
+        return EntryView(self, Severity.ERROR)
+    
+    @property
+    def warnings(self) -> EntryView:
+        """Warnings found during validation."""
+        return EntryView(self, Severity.WARNING)
+    
+    @property
+    def passed(self) -> EntryView:
+        """Validations that passed."""
+        return EntryView(self, Severity.PASSED)
+    
+    def _entries(self, severity: Severity) -> List[ValidationEntry]:
+        """Get the entries of a severity as ValidationEntry objects.
+        
+        Objects are only created for entries added since the previous call.
+        
+        Args:
+            severity: Severity whose entries are requested.
+        
+        Returns:
+            List of entries in insertion order.
+        """
+        entries = self._entry_cache[severity]
+        positions = self._checked_positions(severity)
+        start = len(entries)
+        
+        if start < len(positions):
+            message_codes, column_codes, rows, values = self._store.take(positions[start:])
+            entries.extend(map(
+                ValidationEntry,
+                self._messages.decode(message_codes),
+                self._columns.decode(column_codes),
+                rows,
+                repeat(SEVERITIES[severity]),
+                values
+            ))
+        
+        return entries
+    
+    def _checked_positions(self, severity: Severity) -> array:
+        """Get the store positions of a severity's entries, dropping repeated errors first.
+        
+        Errors are appended unchecked, so no per-row index has to be kept. The
+        errors added since the previous check are compared in one vectorized
+        pass against the earlier errors sharing their message and column, and
+        every repeat is dropped in favour of the first occurrence. Only
+        unchecked positions can be dropped, so entries already materialized
+        stay valid.
+        
+        Args:
+            severity: Severity whose positions are requested.
+        
+        Returns:
+            Positions of the entries, in insertion order.
+        """
+        positions = self._positions[severity]
+        checked = self._checked_errors
+        if severity is not Severity.ERROR or checked == len(positions):
+            return positions
+        
+        import numpy as np
+        
+        store = self._store
+        count = len(positions)
+        order = np.array(positions, dtype=np.int64)
+        keys = (
+            np.fromiter(map(store.message_codes.__getitem__, positions), dtype=np.int64, count=count)
+            * len(self._columns.labels)
+            + np.fromiter(map(store.column_codes.__getitem__, positions), dtype=np.int64, count=count)
+        )
+        if type(store.rows) is array:
+            rows = np.frombuffer(store.rows, dtype=np.int64)[order]
+        else:
+            # Row labels are compared through codes, matching them the way a set would
+            row_codes: Dict[Any, int] = {}
+            rows = np.fromiter(
+                (row_codes.setdefault(row, len(row_codes)) for row in map(store.rows.__getitem__, positions)),
+                dtype=np.int64,
+                count=count
+            )
+        
+        # Only errors sharing a message and column with an unchecked one can be repeats
+        candidates = np.flatnonzero(np.isin(keys, keys[checked:]))
+        # The sort is stable, so each run of equal errors starts with the earliest one
+        ranked = candidates[np.lexsort((rows[candidates], keys[candidates]))]
+        repeated = (keys[ranked[1:]] == keys[ranked[:-1]]) & (rows[ranked[1:]] == rows[ranked[:-1]])
+        
+        if repeated.any():
+            keep = np.ones(count, dtype=bool)
+            keep[ranked[1:][repeated]] = False
+            kept = order[checked:][keep[checked:]]
+            del positions[checked:]
+            positions.extend(array('I', kept.tolist()))
+        
+        self._checked_errors = len(positions)
+        return positions
     
     def add_error(self, message: str, column: str, row: Optional[int] = None, value: Optional[Any] = None) -> None:
         """Add an error to the validation result.
@@ -36,14 +404,47 @@ class ValidationResult:
             row: Row number where error occurred (0-indexed).
             value: The problematic value.
         """
-        entry = ValidationEntry(
-            message=message,
-            column=column,
-            row=row,
-            severity='error',
-            value=value
-        )
-        self.errors.append(entry)
+        self._add(Severity.ERROR, message, column, row, value)
+    
+    def add_errors(self, message: str, column: str, rows: Sequence[int],
+                   values: Optional[Sequence[Any]] = None) -> None:
+        """Add errors sharing a message and column for many rows at once.
+        
+        Args:
+            message: Description of the errors.
+            column: Column name where errors occurred.
+            rows: Row numbers where errors occurred (0-indexed).
+            values: The problematic values, aligned with rows.
+        """
+        self._add_many(Severity.ERROR, message, column, rows, values)
+    
+    def add_errors_from_mask(self, message: str, column: str, mask: 'np.ndarray',
+                             index: Optional[Sequence[Any]] = None,
+                             values: Optional['pd.Series'] = None) -> int:
+        """Add errors sharing a message and column for every row flagged in a mask.
+        
+        Only the flagged positions are converted to Python objects, so this is
+        the preferred way to report the result of a vectorized check.
+        
+        Args:
+            message: Description of the errors.
+            column: Column name where errors occurred.
+            mask: Boolean array, True for each row with an error.
+            index: Row labels aligned with mask. Positions are used if omitted.
+            values: The checked values, aligned with mask.
+        
+        Returns:
+            Number of errors added. Errors repeating one already recorded are
+            counted here and dropped when errors are next read.
+        """
+        from ._fastpath import mask_to_rows
+        
+        if not mask.any():
+            return 0
+        
+        rows = mask_to_rows(mask, index)
+        bad_values = None if values is None else values.iloc[mask].tolist()
+        return self._add_many(Severity.ERROR, message, column, rows, bad_values)
     
     def add_warning(self, message: str, column: str, row: Optional[int] = None, value: Optional[Any] = None) -> None:
         """Add a warning to the validation result.
@@ -54,14 +455,7 @@ class ValidationResult:
             row: Row number where warning occurred (0-indexed).
             value: The value that triggered the warning.
         """
-        entry = ValidationEntry(
-            message=message,
-            column=column,
-            row=row,
-            severity='warning',
-            value=value
-        )
-        self.warnings.append(entry)
+        self._add(Severity.WARNING, message, column, row, value)
     
     def add_passed(self, message: str, column: str, row: Optional[int] = None) -> None:
         """Add a passed validation to the result.
@@ -71,13 +465,180 @@ class ValidationResult:
             column: Column name that passed validation.
             row: Row number that passed validation (0-indexed).
         """
-        entry = ValidationEntry(
-            message=message,
-            column=column,
-            row=row,
-            severity='passed'
-        )
-        self.passed.append(entry)
+        self._add(Severity.PASSED, message, column, row, None)
+    
+    def add_passed_rows(self, message: str, column: str, rows: Sequence[int]) -> None:
+        """Add passed validations sharing a message and column for many rows at once.
+        
+        Args:
+            message: Description of what passed validation.
+            column: Column name that passed validation.
+            rows: Row numbers that passed validation (0-indexed).
+        """
+        self._add_many(Severity.PASSED, message, column, rows)
+    
+    def _add(self, severity: Severity, message: str, column: str, row: Optional[int], value: Optional[Any]) -> None:
+        """Append a single entry to the store and the position table of its severity.
+        
+        Args:
+            severity: Severity of the entry.
+            message: Description of the finding.
+            column: Column name the finding applies to.
+            row: Row number of the finding (0-indexed).
+            value: The value that triggered the finding.
+        """
+        message_code = self._messages.encode(message)
+        column_code = self._columns.encode(column)
+        
+        store = self._store
+        position = len(store)
+        self._positions[severity].append(position)
+        store.message_codes.append(message_code)
+        store.column_codes.append(column_code)
+        store.append_row(row)
+        if value is not None:
+            store.values[position] = value
+    
+    def _add_many(self, severity: Severity, message: str, column: str, rows: Sequence[int],
+                  values: Optional[Sequence[Any]] = None) -> int:
+        """Append entries sharing a severity, message and column for many rows.
+        
+        Args:
+            severity: Severity of the entries.
+            message: Description of the findings.
+            column: Column name the findings apply to.
+            rows: Row numbers of the findings (0-indexed).
+            values: The values that triggered the findings, aligned with rows.
+        
+        Returns:
+            Number of entries added.
+        """
+        message_code = self._messages.encode(message)
+        column_code = self._columns.encode(column)
+        
+        store = self._store
+        start = len(store)
+        count = len(rows)
+        self._positions[severity].extend(range(start, start + count))
+        store.message_codes.extend(repeat(message_code, count))
+        store.column_codes.extend(repeat(column_code, count))
+        store.extend_rows(rows)
+        if values is not None:
+            store.values.update(
+                (position, value) for position, value in enumerate(values, start) if value is not None
+            )
+        return count
+    
+    def merge(self, other: 'ValidationResult') -> None:
+        """Append all entries of another validation result to this one.
+        
+        Args:
+            other: ValidationResult whose entries should be added.
+        """
+        message_map = [self._messages.encode(label) for label in other._messages.labels]
+        column_map = [self._columns.encode(label) for label in other._columns.labels]
+        other_store = other._store
+        store = self._store
+        
+        # Errors the other result shares with this one are appended too, and dropped when errors are next read
+        offset = len(store)
+        for positions, added in zip(self._positions, other._positions):
+            positions.extend(array('I', map(offset.__add__, added)))
+        
+        store.message_codes.extend(map(message_map.__getitem__, other_store.message_codes))
+        store.column_codes.extend(map(column_map.__getitem__, other_store.column_codes))
+        store.extend_rows(other_store.row_list())
+        store.values.update(zip(map(offset.__add__, other_store.values), other_store.values.values()))
+    
+    def _ordered_columns(self) -> Tuple[List[int], List[int], List[int], List[Any], List[Any]]:
+        """Gather all entries ordered errors, warnings, then passed.
+        
+        Returns:
+            Severity codes, message codes, column codes, rows and values.
+        """
+        tables = [self._checked_positions(severity) for severity in Severity]
+        order = array('I')
+        for positions in tables:
+            order.extend(positions)
+        
+        severity_codes = list(chain.from_iterable(
+            repeat(severity, len(positions)) for severity, positions in zip(Severity, tables)
+        ))
+        return (severity_codes, *self._store.take(order))
+    
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Export all entries as parallel lists, ordered errors, warnings, then passed.
+        
+        Returns:
+            Dictionary mapping 'severity', 'column', 'row', 'message' and 'value'
+            to lists of equal length.
+        """
+        severity_codes, message_codes, column_codes, rows, values = self._ordered_columns()
+        
+        columns: Dict[str, List[Any]] = {
+            'severity': list(map(SEVERITIES.__getitem__, severity_codes)),
+            'column': self._columns.decode(column_codes),
+            'row': rows,
+            'message': self._messages.decode(message_codes),
+            'value': values
+        }
+        
+        return columns
+    
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """Export all entries as a DataFrame, ordered errors, warnings, then passed.
+        
+        The severity, column and message columns are categoricals built directly
+        from the stored codes, so no label is decoded per entry.
+        
+        Returns:
+            DataFrame with 'severity', 'column', 'row', 'message' and 'value' columns.
+        """
+        import pandas as pd
+        
+        severity_codes, message_codes, column_codes, rows, values = self._ordered_columns()
+        
+        return pd.DataFrame({
+            'severity': pd.Categorical.from_codes(severity_codes, categories=list(SEVERITIES)),
+            'column': pd.Categorical.from_codes(column_codes, categories=self._columns.labels),
+            'row': pd.Series(rows, dtype=object),
+            'message': pd.Categorical.from_codes(message_codes, categories=self._messages.labels),
+            'value': pd.Series(values, dtype=object)
+        })
+    
+    def to_arrow(self) -> 'pa.Table':
+        """Export all entries as a PyArrow table, ordered errors, warnings, then passed.
+        
+        The severity, column and message columns are dictionary-encoded straight
+        from the stored codes. Arrow columns hold a single type, so rows, values
+        or labels of mixed types are exported as their string representation.
+        
+        Returns:
+            Table with 'severity', 'column', 'row', 'message' and 'value' columns.
+        
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        import pyarrow as pa
+        
+        def _array(items: List[Any]) -> 'pa.Array':
+            try:
+                return pa.array(items, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                return pa.array([None if item is None else str(item) for item in items], type=pa.string())
+        
+        def _dictionary(codes: List[int], labels: List[Any]) -> 'pa.DictionaryArray':
+            return pa.DictionaryArray.from_arrays(pa.array(codes, type=pa.int32()), _array(labels))
+        
+        severity_codes, message_codes, column_codes, rows, values = self._ordered_columns()
+        
+        return pa.table({
+            'severity': _dictionary(severity_codes, list(SEVERITIES)),
+            'column': _dictionary(column_codes, self._columns.labels),
+            'row': _array(rows),
+            'message': _dictionary(message_codes, self._messages.labels),
+            'value': _array(values)
+        })
     
     def has_errors(self) -> bool:
         """Check if validation result has any errors.
@@ -85,7 +646,7 @@ class ValidationResult:
         Returns:
             True if there are errors, False otherwise.
         """
-        return len(self.errors) > 0
+        return bool(self._positions[Severity.ERROR])
     
     def has_warnings(self) -> bool:
         """Check if validation result has any warnings.
@@ -93,18 +654,40 @@ class ValidationResult:
         Returns:
             True if there are warnings, False otherwise.
         """
-        return len(self.warnings) > 0
+        return bool(self._positions[Severity.WARNING])
     
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of the validation results.
         
+        The summary is cached and the same dictionary is returned until entries
+        are added or the source file changes.
+        
         Returns:
             Dictionary containing summary statistics.
         """
-        return {
+        counts = self._counts()
+        key = (self.source_file, *counts)
+        if self._summary_cache is not None and self._summary_cache[0] == key:
+            return self._summary_cache[1]
+        
+        total_errors, total_warnings, total_passed = counts
+        summary = {
             'source_file': self.source_file,
-            'total_errors': len(self.errors),
-            'total_warnings': len(self.warnings),
-            'total_passed': len(self.passed),
-            'total_issues': len(self.errors) + len(self.warnings)
-        }
\ No newline at end of file
+            'total_errors': total_errors,
+            'total_warnings': total_warnings,
+            'total_passed': total_passed,
+            'total_issues': total_errors + total_warnings
+        }
+        self._summary_cache = (key, summary)
+        return summary
+    
+    def _counts(self) -> Tuple[int, ...]:
+        """Get the number of entries per severity, in Severity order.
+        
+        The per-severity position tables keep their own lengths, so this is a
+        constant-time snapshot once repeated errors have been dropped.
+        
+        Returns:
+            Tuple of entry counts.
+        """
+        return tuple([len(self._checked_positions(severity)) for severity in Severity])
\ No newline at end of file
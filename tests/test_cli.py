@@ -3,10 +3,11 @@ import tempfile
 import os
 import json
 from pathlib import Path
-import pandas as pd
 
 from src.cli import CLI, CommandParser
 
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
 
 class TestCLI:
     
@@ -15,18 +16,16 @@ class TestCLI:
         """Create a CLI instance for testing."""
         return CLI()
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def sample_excel_file(self):
-        """Create a sample Excel file for testing."""
-        data = pd.DataFrame({
-            'id': [1, 2, None, 4],
-            'name': ['Alice', 'Bob', 'Charlie', ''],
-            'age': [25, 'invalid', 30, 35]
-        })
+        """Copy a prewritten sample workbook to a temporary Excel file.
         
+        The workbook holds ids [1, 2, None, 4], names ['Alice', 'Bob', 'Charlie', '']
+        and ages [25, 'invalid', 30, 35].
+        """
         with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
-            data.to_excel(tmp.name, index=False)
-            yield tmp.name
+            tmp.write((FIXTURES_DIR / 'cli_sample.xlsx').read_bytes())
+        yield tmp.name
         os.unlink(tmp.name)
     
     def test_command_parser_initialization(self):
@@ -46,6 +45,7 @@ class TestCLI:
         assert isinstance(args['rules'], dict)
         assert 'data_types' in args['rules']
     
+    @pytest.mark.slow
     def test_validate_command_execution(self, cli_instance, sample_excel_file):
         """Test execution of validate command."""
         rules = {
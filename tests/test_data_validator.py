@@ -4,15 +4,27 @@ import numpy as np
 from pathlib import Path
 import tempfile
 import os
+import re
+import tracemalloc
+import zipfile
+from datetime import date, time
+from decimal import Decimal
+import openpyxl
 
-from src.data_validator import DataValidator, ValidationResult
+from src.data_validator import DataValidator, ValidationResult, _column_runs, _excel_cell_value
+from src._fastpath import int_mask, int_mask_numpy, mask_to_rows
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
 
 
 class TestDataValidator:
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def sample_data(self):
-        """Create sample data for testing."""
+        """Create sample data for testing, shared by the tests in this module.
+        
+        fixtures/sample.xlsx holds the same table; regenerate it if this changes.
+        """
         return pd.DataFrame({
             'id': [1, 2, 3, None, 5],
             'name': ['Alice', 'Bob', '', 'David', 'Eve'],
@@ -21,12 +33,12 @@ class TestDataValidator:
             'department': ['Engineering', 'Sales', 'Engineering', 'HR', 'Sales']
         })
     
-    @pytest.fixture
-    def temp_excel_file(self, sample_data):
-        """Create a temporary Excel file for testing."""
+    @pytest.fixture(scope='module')
+    def temp_excel_file(self):
+        """Copy the prewritten sample_data workbook to a temporary Excel file."""
         with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
-            sample_data.to_excel(tmp.name, index=False)
-            yield tmp.name
+            tmp.write((FIXTURES_DIR / 'sample.xlsx').read_bytes())
+        yield tmp.name
         os.unlink(tmp.name)
     
     def test_validator_initialization(self):
@@ -44,6 +56,44 @@ class TestDataValidator:
         assert any('id' in error.column for error in result.errors)
         assert any('salary' in error.column for error in result.errors)
     
+    def test_detect_missing_values_rows(self, sample_data):
+        """Test that missing values are reported with their row and kind."""
+        validator = DataValidator()
+        result = validator.detect_missing_values(sample_data)
+        
+        findings = {(error.column, error.row, error.message) for error in result.errors}
+        assert findings == {
+            ('id', 3, 'Missing value (null/NaN)'),
+            ('name', 2, 'Missing value (empty string)'),
+            ('salary', 2, 'Missing value (null/NaN)')
+        }
+        assert len(result.passed) == len(sample_data.columns)
+    
+    def test_detect_missing_values_mixed_columns(self):
+        """Test blank detection in object columns holding lists and long strings."""
+        validator = DataValidator()
+        data = pd.DataFrame({
+            'tags': [['a', 'b'], (), '  ', 'c'],
+            'note': ['x' * 20_000, 1, '', 2.5]
+        })
+        
+        result = validator.detect_missing_values(data)
+        
+        assert {(error.column, error.row) for error in result.errors} == {('tags', 2), ('note', 2)}
+    
+    def test_detect_missing_values_long_string_memory(self):
+        """Test that one long string does not size the blank check for the whole column."""
+        validator = DataValidator()
+        data = pd.DataFrame({'note': ['x' * 20_000] + [1, ''] * 5_000})
+        
+        tracemalloc.start()
+        result = validator.detect_missing_values(data)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        
+        assert len(result.errors) == 5_000
+        assert peak < 50 * 2 ** 20
+    
     def test_detect_data_type_errors(self, sample_data):
         """Test detection of incorrect data types."""
         validator = DataValidator()
@@ -60,6 +110,86 @@ class TestDataValidator:
         assert len(result.errors) > 0
         assert any('age' in error.column for error in result.errors)
     
+    def test_validate_data_types_invalid_rows(self, sample_data):
+        """Test that only invalid values are reported, with passed values aggregated."""
+        validator = DataValidator()
+        result = validator.validate_data_types(sample_data, {'age': 'int', 'salary': 'float'})
+        
+        assert [(error.column, error.row, error.value) for error in result.errors] == [('age', 1, 'invalid')]
+        assert [(passed.column, passed.message) for passed in result.passed] == [
+            ('age', '4 valid int values'),
+            ('salary', '4 valid float values')
+        ]
+    
+    def test_validate_data_types_homogeneous_columns(self):
+        """Test that columns whose dtype matches the rule are accepted wholesale."""
+        validator = DataValidator()
+        df = pd.DataFrame({
+            'count': [1, 2, 3],
+            'ratio': [0.5, 1.0, 2.5],
+            'flag': [True, False, True],
+            'label': ['a', None, 'c']
+        })
+        type_rules = {'count': 'int', 'ratio': 'float', 'flag': 'bool', 'label': 'str'}
+        
+        result = validator.validate_data_types(df, type_rules)
+        
+        assert result.errors == []
+        assert [passed.message for passed in result.passed] == [
+            '3 valid int values',
+            '3 valid float values',
+            '3 valid bool values',
+            '2 valid str values'
+        ]
+    
+    def test_collect_passed(self, sample_data):
+        """Test recording one passed entry per valid value when requested."""
+        validator = DataValidator(collect_passed=True)
+        result = validator.validate_data_types(sample_data, {'age': 'int', 'department': 'str'})
+        
+        assert [(passed.column, passed.row) for passed in result.passed] == [
+            ('age', 0), ('age', 2), ('age', 3), ('age', 4),
+            ('department', 0), ('department', 1), ('department', 2), ('department', 3), ('department', 4)
+        ]
+        assert {passed.message for passed in result.passed} == {'Valid int value', 'Valid str value'}
+    
+    def test_parallel_matches_serial(self, sample_data, monkeypatch):
+        """Test that threaded column validation reports the same entries in the same order."""
+        type_rules = {'id': 'int', 'age': 'int', 'salary': 'float', 'name': 'str', 'missing': 'int'}
+        serial = DataValidator(max_workers=1)
+        expected_missing = serial.detect_missing_values(sample_data).to_columns()
+        expected_types = serial.validate_data_types(sample_data, type_rules).to_columns()
+        
+        monkeypatch.setattr('src.data_validator._PARALLEL_MIN_CELLS', 0)
+        parallel = DataValidator(max_workers=4)
+        
+        assert parallel.detect_missing_values(sample_data).to_columns() == expected_missing
+        assert parallel.validate_data_types(sample_data, type_rules).to_columns() == expected_types
+    
+    def test_int_mask(self):
+        """Test the integer-valued mask, compiled or not, against the numpy reference."""
+        values = np.array([1.0, 2.5, -3.0, np.nan, np.inf, -np.inf, 0.0, 1e15])
+        expected = [True, False, True, False, False, False, True, True]
+        
+        assert int_mask(values).tolist() == expected
+        assert int_mask_numpy(values).tolist() == expected
+    
+    def test_mask_to_rows(self):
+        """Test expanding a boolean mask into positions or row labels."""
+        mask = np.array([False, True, True, False])
+        
+        assert mask_to_rows(mask) == [1, 2]
+        assert mask_to_rows(mask, np.array(['a', 'b', 'c', 'd'])) == ['b', 'c']
+        assert mask_to_rows(np.zeros(0, dtype=bool)) == []
+    
+    def test_column_runs(self):
+        """Test merging of adjacent cell positions into per-row runs."""
+        cells = [(2, 1), (2, 2), (2, 3), (2, 5), (3, 5), (3, 6), (4, 1)]
+        
+        assert list(_column_runs(cells)) == [(2, 1, 3), (2, 5, 5), (3, 5, 6), (4, 1, 1)]
+        assert list(_column_runs([])) == []
+    
+    @pytest.mark.slow
     def test_validate_excel_file(self, temp_excel_file):
         """Test validation of an Excel file."""
         validator = DataValidator()
@@ -78,6 +208,85 @@ class TestDataValidator:
         assert isinstance(result, ValidationResult)
         assert result.source_file == temp_excel_file
     
+    def test_validate_csv_file(self, sample_data):
+        """Test validation of a CSV file."""
+        validator = DataValidator()
+        
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as tmp:
+            sample_data.assign(hired=['2020-01-01'] * len(sample_data)).to_csv(tmp.name, index=False)
+        
+        result = validator.validate_file(tmp.name, {'data_types': {'age': 'int', 'hired': 'str'}})
+        os.unlink(tmp.name)
+        
+        assert result.source_file == tmp.name
+        assert [(error.column, error.row) for error in result.errors if 'type' in error.message] == [('age', 1)]
+        assert {(error.column, error.row) for error in result.errors if 'Missing' in error.message} == {
+            ('id', 3), ('name', 2), ('salary', 2)
+        }
+    
+    def _validate_csv_text(self, text, rules):
+        """Write CSV text to a temporary file and validate it."""
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as tmp:
+            tmp.write(text)
+        
+        result = DataValidator().validate_file(tmp.name, rules)
+        os.unlink(tmp.name)
+        return result
+    
+    def test_validate_csv_duplicate_headers(self):
+        """Test that repeated CSV headers are renamed like pandas does."""
+        result = self._validate_csv_text('a,a,b\n1,x,3\n2,4,5\n', {'data_types': {'a': 'int', 'a.1': 'int'}})
+        
+        assert list(result.source_data.columns) == ['a', 'a.1', 'b']
+        assert [(error.column, error.row) for error in result.errors] == [('a.1', 0)]
+    
+    def test_validate_csv_blank_header(self):
+        """Test that a blank CSV header gets pandas' placeholder name."""
+        result = self._validate_csv_text('a,,c\n1,2,3\n', {})
+        
+        assert list(result.source_data.columns) == ['a', 'Unnamed: 1', 'c']
+    
+    def test_validate_csv_ragged_rows(self):
+        """Test that short CSV rows are padded with missing values."""
+        result = self._validate_csv_text('a,b\n1,2\n3\n', {})
+        
+        assert [(error.column, error.row) for error in result.errors] == [('b', 1)]
+    
+    def test_validate_csv_missing_value_tokens(self):
+        """Test that pandas' missing-value tokens in a CSV are reported as missing."""
+        result = self._validate_csv_text('a,b\nNone,x\n<NA>,y\nz,NULL\n', {})
+        
+        assert {(error.column, error.row) for error in result.errors} == {('a', 0), ('a', 1), ('b', 2)}
+    
+    def test_validate_csv_boolean_tokens(self):
+        """Test that only pandas' boolean tokens make a CSV column boolean."""
+        result = self._validate_csv_text('flag\n1\n0\ntrue\nfalse\n', {'data_types': {'flag': 'int'}})
+        
+        assert [(error.row, error.value) for error in result.errors] == [(2, 'true'), (3, 'false')]
+    
+    def test_validate_csv_large_integers(self):
+        """Test that integers beyond the int64 range keep all their digits."""
+        result = self._validate_csv_text('id,n\n12345678901234567890,1\n5,2\n', {})
+        
+        assert str(result.source_data['id'][0]) == '12345678901234567890'
+    
+    def test_validate_file_extension_case(self, sample_data):
+        """Test that file formats are recognized regardless of extension case."""
+        validator = DataValidator()
+        
+        with tempfile.NamedTemporaryFile(suffix='.CSV', delete=False) as tmp:
+            sample_data.to_csv(tmp.name, index=False)
+        result = validator.validate_file(tmp.name, {})
+        os.unlink(tmp.name)
+        
+        assert result.has_errors()
+        
+        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as tmp:
+            with pytest.raises(ValueError, match='Unsupported file format'):
+                validator.validate_file(tmp.name, {})
+        os.unlink(tmp.name)
+    
+    @pytest.mark.slow
     def test_generate_colored_output(self, temp_excel_file):
         """Test generation of color-coded Excel output."""
         validator = DataValidator()
@@ -97,14 +306,109 @@ class TestDataValidator:
             # Verify the output file exists and has expected structure
             assert Path(output_file.name).exists()
             
-            # Read back and verify structure
-            df_summary = pd.read_excel(output_file.name, sheet_name='Summary')
-            df_lineage = pd.read_excel(output_file.name, sheet_name='Data_Lineage')
+            # Inspect the package parts directly rather than parsing the workbook
+            with zipfile.ZipFile(output_file.name) as workbook:
+                sheet_names = re.findall(r'<sheet name="([^"]+)"', workbook.read('xl/workbook.xml').decode())
+                summary_xml = workbook.read('xl/worksheets/sheet2.xml').decode()
+                lineage_xml = workbook.read('xl/worksheets/sheet3.xml').decode()
+                # xlsxwriter stores strings in a shared table, openpyxl inline
+                if 'xl/sharedStrings.xml' in workbook.namelist():
+                    lineage_xml += workbook.read('xl/sharedStrings.xml').decode()
+            
+            assert sheet_names == ['Validated_Data', 'Summary', 'Data_Lineage']
+            assert '<row r="2"' in summary_xml
+            assert '<row r="2"' in lineage_xml
+            assert 'source_file' in lineage_xml
+            
+        os.unlink(output_file.name)
+    
+    @pytest.mark.slow
+    def test_colored_output_highlights_errors(self, temp_excel_file):
+        """Test that cells with findings are filled with their severity color."""
+        validator = DataValidator()
+        result = validator.validate_file(temp_excel_file, {'data_types': {'age': 'int'}})
+        
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as output_file:
+            validator.generate_colored_output(result, output_file.name)
+            
+            worksheet = openpyxl.load_workbook(output_file.name)['Validated_Data']
+            assert worksheet['A5'].fill.start_color.rgb.endswith('FFCCCC')  # id is null in row 3
+            assert worksheet['C3'].fill.start_color.rgb.endswith('FFCCCC')  # age is 'invalid' in row 1
+            assert worksheet['A2'].fill.fill_type is None
+        
+        os.unlink(output_file.name)
+    
+    def test_excel_cell_value(self):
+        """Test that cell values are converted the way DataFrame.to_excel writes them."""
+        formats = ('YYYY-MM-DD HH:MM:SS', 'YYYY-MM-DD')
+        
+        assert _excel_cell_value(np.int64(3), *formats) == (3, None)
+        assert _excel_cell_value(np.float64('-inf'), *formats) == ('-inf', None)
+        assert _excel_cell_value(np.bool_(True), *formats) == (True, None)
+        assert _excel_cell_value(None, *formats) == ('', None)
+        assert _excel_cell_value(pd.Timestamp('2020-01-02'), *formats) == (pd.Timestamp('2020-01-02'), formats[0])
+        assert _excel_cell_value(date(2020, 1, 2), *formats) == (date(2020, 1, 2), formats[1])
+        assert _excel_cell_value(pd.Timedelta(hours=6), *formats) == (0.25, '0')
+        assert _excel_cell_value(Decimal('1.5'), *formats) == ('1.5', None)
+        assert _excel_cell_value(time(1, 2), *formats) == ('01:02:00', None)
+        assert _excel_cell_value(['a'], *formats) == ("['a']", None)
+    
+    @pytest.mark.slow
+    def test_colored_output_highlights_errors_openpyxl(self, temp_excel_file, monkeypatch):
+        """Test that the openpyxl writer fills cells with findings, including adjacent ones."""
+        monkeypatch.setattr('src.data_validator._EXCEL_WRITER_ENGINE', 'openpyxl')
+        validator = DataValidator()
+        result = validator.validate_file(temp_excel_file, {'data_types': {'age': 'int'}})
+        # Two adjacent cells in one row, filled as a single run
+        result.add_error('Flagged', 'age', 4)
+        result.add_error('Flagged', 'salary', 4)
+        
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as output_file:
+            validator.generate_colored_output(result, output_file.name)
             
-            assert not df_summary.empty
-            assert not df_lineage.empty
-            assert 'source_file' in df_lineage.columns
+            worksheet = openpyxl.load_workbook(output_file.name)['Validated_Data']
+            for cell in ('A5', 'B4', 'C3', 'D4', 'C6', 'D6'):
+                assert worksheet[cell].fill.start_color.rgb.endswith('FFCCCC'), cell
+            assert worksheet['A2'].fill.fill_type is None
+            assert worksheet['B6'].fill.fill_type is None
+            assert worksheet['C3'].value == 'invalid'
+        
+        os.unlink(output_file.name)
+    
+    @pytest.mark.slow
+    def test_colored_output_keeps_highlighted_values(self):
+        """Test that highlighted cells hold the same values as the rest of the sheet."""
+        validator = DataValidator()
+        data = pd.DataFrame({'start': [time(1, 2), time(3, 4)], 'tags': [['a', 'b'], 'c']})
+        result = validator.validate_data_types(data, {'start': 'str', 'tags': 'str'})
+        result.source_data = data
+        
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as output_file:
+            validator.generate_colored_output(result, output_file.name)
             
+            worksheet = openpyxl.load_workbook(output_file.name)['Validated_Data']
+            assert worksheet['A2'].fill.start_color.rgb.endswith('FFCCCC')
+            assert worksheet['A2'].value == '01:02:00'
+            assert worksheet['B2'].fill.start_color.rgb.endswith('FFCCCC')
+            assert worksheet['B2'].value == "['a', 'b']"
+            assert worksheet['B3'].value == 'c'
+        
+        os.unlink(output_file.name)
+    
+    @pytest.mark.slow
+    def test_colored_output_reuses_parsed_data(self, sample_data):
+        """Test that report generation does not re-read the validated file."""
+        validator = DataValidator()
+        
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
+            sample_data.to_excel(tmp.name, index=False)
+        result = validator.validate_file(tmp.name, {'data_types': {'age': 'int'}})
+        os.unlink(tmp.name)
+        
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as output_file:
+            validator.generate_colored_output(result, output_file.name)
+            assert Path(output_file.name).exists()
+        
         os.unlink(output_file.name)
     
     def test_empty_dataframe_handling(self):
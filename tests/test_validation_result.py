@@ -1,5 +1,8 @@
+import pickle
 import pytest
-from src.validation_result import ValidationResult, ValidationEntry
+import sys
+import tracemalloc
+from src.validation_result import ValidationResult, ValidationEntry, Severity, SEVERITIES
 
 
 class TestValidationResult:
@@ -63,6 +66,20 @@ class TestValidationResult:
         assert summary['total_passed'] == 1
         assert summary['source_file'] == 'test.xlsx'
     
+    def test_get_summary_cached(self):
+        """Test that the summary is reused until the result changes."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_error('Error 1', 'col1', 1)
+        summary = result.get_summary()
+        
+        assert result.get_summary() is summary
+        
+        result.add_warning('Warning 1', 'col2', 2)
+        assert result.get_summary()['total_issues'] == 2
+        
+        result.source_file = 'other.xlsx'
+        assert result.get_summary()['source_file'] == 'other.xlsx'
+    
     def test_validation_entry(self):
         """Test ValidationEntry structure."""
         entry = ValidationEntry(
@@ -76,6 +93,20 @@ class TestValidationResult:
         assert entry.column == 'test_col'
         assert entry.row == 1
         assert entry.severity == 'error'
+        assert not hasattr(entry, '__dict__')
+        assert hash(entry) == hash(ValidationEntry('Test message', 'test_col', 1, 'error', ['unhashable']))
+        
+        with pytest.raises(AttributeError):
+            entry.row = 2
+    
+    def test_severity_names(self):
+        """Test that severities index their names and entries expose the name."""
+        assert [SEVERITIES[severity] for severity in Severity] == ['error', 'warning', 'passed']
+        
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_warning('Warning 1', 'col1', 1)
+        
+        assert result.warnings[0].severity == SEVERITIES[Severity.WARNING]
     
     def test_has_errors(self):
         """Test checking if result has errors."""
@@ -91,4 +122,252 @@ class TestValidationResult:
         assert not result.has_warnings()
         
         result.add_warning('Test warning', 'col', 1)
-        assert result.has_warnings()
\ No newline at end of file
+        assert result.has_warnings()
+    
+    def test_add_errors(self):
+        """Test adding errors for many rows at once."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_errors('Missing value', 'name', [1, 4], ['', None])
+        
+        assert [(error.column, error.row, error.value) for error in result.errors] == [
+            ('name', 1, ''),
+            ('name', 4, None)
+        ]
+        assert all(error.message == 'Missing value' for error in result.errors)
+    
+    def test_add_errors_from_mask(self):
+        """Test adding errors for the rows flagged in a boolean mask."""
+        import numpy as np
+        import pandas as pd
+        
+        result = ValidationResult(source_file='test.xlsx')
+        values = pd.Series([1, 'x', 3, 'y'], index=[10, 11, 12, 13])
+        mask = np.array([False, True, False, True])
+        
+        assert result.add_errors_from_mask('Invalid', 'age', mask, values.index, values) == 2
+        assert result.add_errors_from_mask('Invalid', 'age', np.zeros(4, dtype=bool)) == 0
+        assert result.add_errors_from_mask('Missing', 'name', mask) == 2
+        
+        assert [(error.message, error.row, error.value) for error in result.errors] == [
+            ('Invalid', 11, 'x'),
+            ('Invalid', 13, 'y'),
+            ('Missing', 1, None),
+            ('Missing', 3, None)
+        ]
+    
+    def test_duplicate_errors_ignored(self):
+        """Test that an error is recorded once per message, column and row."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_error('Missing value', 'name', 1)
+        result.add_error('Missing value', 'name', 1, 'again')
+        result.add_errors('Missing value', 'name', [1, 2, 2])
+        
+        other = ValidationResult(source_file='other.xlsx')
+        other.add_error('Missing value', 'name', 2)
+        other.add_error('Missing value', 'name', 3)
+        result.merge(other)
+        
+        assert [(error.row, error.value) for error in result.errors] == [(1, None), (2, None), (3, None)]
+    
+    def test_concatenate_entry_views(self):
+        """Test that the views concatenate with each other and with lists."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_error('Error 1', 'col1', 1)
+        result.add_warning('Warning 1', 'col2', 2)
+        result.add_passed('Passed 1', 'col3')
+        
+        all_entries = result.errors + result.warnings + result.passed
+        
+        assert [entry.message for entry in all_entries] == ['Error 1', 'Warning 1', 'Passed 1']
+        assert [] + result.errors == list(result.errors)
+    
+    def test_duplicate_errors_after_read(self):
+        """Test that repeats added after errors were read are dropped without touching earlier entries."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_errors('Missing value', 'name', [1, 2])
+        first = result.errors[0]
+        
+        result.add_error('Missing value', 'name', 2, 'again')
+        result.add_errors('Missing value', 'name', [3, 1, 3])
+        
+        assert [error.row for error in result.errors] == [1, 2, 3]
+        assert result.errors[0] is first
+        assert result.get_summary()['total_errors'] == 3
+    
+    def test_error_storage_memory(self):
+        """Test that recording errors keeps no per-row index beyond the packed storage."""
+        tracemalloc.start()
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_errors('Missing value', 'name', range(100_000))
+        assert len(result.errors) == 100_000
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        # Packed rows, code lists and positions take about 3 MB; a set of boxed rows alone adds as much again
+        assert retained < 5 * 2 ** 20
+    
+    def test_add_passed_rows(self):
+        """Test adding passed validations for many rows at once."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_passed_rows('Valid int value', 'age', [0, 2])
+        
+        assert [(passed.column, passed.row, passed.severity) for passed in result.passed] == [
+            ('age', 0, 'passed'),
+            ('age', 2, 'passed')
+        ]
+    
+    def test_merge(self):
+        """Test merging entries from another validation result."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_error('Error 1', 'col1', 1)
+        
+        other = ValidationResult(source_file='')
+        other.add_warning('Warning 1', 'col2', 2)
+        other.add_error('Error 1', 'col3', 3, 'x')
+        other.add_passed('Passed 1', 'col1')
+        result.merge(other)
+        
+        assert result.errors == [
+            ValidationEntry('Error 1', 'col1', 1, 'error'),
+            ValidationEntry('Error 1', 'col3', 3, 'error', 'x')
+        ]
+        assert result.warnings == [ValidationEntry('Warning 1', 'col2', 2, 'warning')]
+        assert result.passed == [ValidationEntry('Passed 1', 'col1', None, 'passed')]
+    
+    def test_to_columns(self):
+        """Test exporting entries as parallel columns."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_passed('Passed 1', 'col3')
+        result.add_warning('Warning 1', 'col2', 2)
+        result.add_error('Error 1', 'col1', 1, 'bad')
+        
+        assert result.to_columns() == {
+            'severity': ['error', 'warning', 'passed'],
+            'column': ['col1', 'col2', 'col3'],
+            'row': [1, 2, None],
+            'message': ['Error 1', 'Warning 1', 'Passed 1'],
+            'value': ['bad', None, None]
+        }
+    
+    def test_entries_reused(self):
+        """Test that entry objects are created once and reused across accesses."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_error('Error 1', 'col1', 1)
+        first = result.errors[0]
+        
+        result.add_error('Error 2', 'col1', 2)
+        
+        assert result.errors[0] is first
+        assert [error.message for error in result.errors] == ['Error 1', 'Error 2']
+    
+    def test_column_names_interned(self):
+        """Test that equal column names share a single string object."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_error('Error 1', ''.join(['col', '1']), 1)
+        result.add_error('Error 2', ''.join(['col', '1']), 2)
+        
+        first, second = result.errors
+        assert first.column is second.column
+        assert first.column is sys.intern('col1')
+    
+    def test_to_dataframe(self):
+        """Test exporting entries as a DataFrame with categorical labels."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_passed('Passed 1', 'col1')
+        result.add_errors('Error 1', 'col1', [1, 3], ['bad', 'worse'])
+        
+        df = result.to_dataframe()
+        
+        assert df.to_dict('list') == {
+            'severity': ['error', 'error', 'passed'],
+            'column': ['col1', 'col1', 'col1'],
+            'row': [1, 3, None],
+            'message': ['Error 1', 'Error 1', 'Passed 1'],
+            'value': ['bad', 'worse', None]
+        }
+        assert list(df['column'].cat.categories) == ['col1']
+        assert len(ValidationResult(source_file='').to_dataframe()) == 0
+    
+    def test_to_arrow(self):
+        """Test exporting entries as a PyArrow table."""
+        pytest.importorskip('pyarrow')
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_passed('Passed 1', 'col1')
+        result.add_errors('Error 1', 'col1', [1, 3], ['bad', 2.5])
+        
+        table = result.to_arrow()
+        
+        assert table.column_names == ['severity', 'column', 'row', 'message', 'value']
+        assert table.to_pydict() == {
+            'severity': ['error', 'error', 'passed'],
+            'column': ['col1', 'col1', 'col1'],
+            'row': [1, 3, None],
+            'message': ['Error 1', 'Error 1', 'Passed 1'],
+            'value': ['bad', '2.5', None]
+        }
+        assert ValidationResult(source_file='').to_arrow().num_rows == 0
+    
+    def test_pickle_round_trip(self):
+        """Test that a pickled result keeps its entries but not its parsed data."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.source_data = object()
+        result.add_errors('Missing value', 'name', [1, 4])
+        result.add_warning('Warning 1', 'col2', 2, 'x')
+        result.add_passed('Passed 1', 'col3')
+        list(result.errors)
+        
+        restored = pickle.loads(pickle.dumps(result))
+        
+        assert restored.source_file == 'test.xlsx'
+        assert restored.source_data is None
+        assert restored.to_columns() == result.to_columns()
+        assert restored.get_summary() == result.get_summary()
+        
+        restored.add_error('Missing value', 'name', 4)
+        assert len(restored.errors) == 2
+    
+    def test_row_labels_round_trip(self):
+        """Test that rows keep their labels whether they fit packed storage or not."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_errors('Packed', 'col1', [0, -1, 2 ** 40])
+        result.add_error('Packed', 'col1', None)
+        assert [error.row for error in result.errors] == [0, -1, 2 ** 40, None]
+        
+        result.add_errors('Labelled', 'col1', ['a', None, 2 ** 70])
+        assert [error.row for error in result.errors] == [0, -1, 2 ** 40, None, 'a', None, 2 ** 70]
+    
+    def test_interleaved_severities(self):
+        """Test that entries added in mixed order keep per-severity order through merge."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_passed('Passed 1', 'col1')
+        result.add_error('Error 1', 'col1', 1)
+        result.add_warning('Warning 1', 'col2', 2)
+        result.add_error('Error 2', 'col2', 3)
+        
+        other = ValidationResult(source_file='other.xlsx')
+        other.add_warning('Warning 2', 'col3', 4)
+        other.add_error('Error 1', 'col1', 1)
+        other.add_error('Error 3', 'col3', 5)
+        result.merge(other)
+        
+        assert [error.message for error in result.errors] == ['Error 1', 'Error 2', 'Error 3']
+        assert [warning.message for warning in result.warnings] == ['Warning 1', 'Warning 2']
+        assert [entry.message for entry in result.passed] == ['Passed 1']
+        assert result.to_columns()['message'] == [
+            'Error 1', 'Error 2', 'Error 3', 'Warning 1', 'Warning 2', 'Passed 1'
+        ]
+    
+    def test_values_survive_merge(self):
+        """Test that values stay attached to their entries when some entries carry none."""
+        result = ValidationResult(source_file='test.xlsx')
+        result.add_errors('Invalid type', 'col1', [1, 2, 3], ['a', None, 'c'])
+        
+        other = ValidationResult(source_file='other.xlsx')
+        other.add_error('Invalid type', 'col1', 2, 'dropped')
+        other.add_warning('Warning 1', 'col2', 4, 0)
+        other.add_error('Invalid type', 'col1', 5, 'e')
+        result.merge(other)
+        
+        assert [error.value for error in result.errors] == ['a', None, 'c', 'e']
+        assert [warning.value for warning in result.warnings] == [0]
+        assert result.to_columns()['value'] == ['a', None, 'c', 'e', 0]